@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 from abc import ABC, abstractmethod
+from asyncio import CancelledError, current_task, get_running_loop
 from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum, auto
@@ -28,7 +29,7 @@ class CancelReason:
     code: str | None = None
 
 
-CancelCallback = Callable[[CancelReason], None]
+type CancelCallback = Callable[[CancelReason], None]
 
 
 class Trigger(ABC):
@@ -42,6 +43,8 @@ class Trigger(ABC):
     Returns a `TriggerHandle` responsible for cleanup.
     """
 
+    __slots__ = ("__weakref__",)
+
     @abstractmethod
     def check(self) -> CancelReason | None: ...
 
@@ -56,10 +59,17 @@ class TriggerHandle(ABC):
     `disarm()` — stops monitoring and cleans up resources.
     """
 
+    __slots__ = ("__weakref__",)
+
     @abstractmethod
     def disarm(self) -> None: ...
 
 
+# Fence lifecycle bits, packed into Fence._state
+_ENTERED = 1
+_EXITED = 2
+
+
 class Fence:
     """
     Sync context manager that arms triggers against the current task.
@@ -72,42 +82,72 @@ class Fence:
     and nested asyncio.timeout scopes.
     """
 
+    __slots__ = (
+        "__weakref__",
+        "_cancel_reasons",
+        "_cancel_token",
+        "_cancelling",
+        "_current_task",
+        "_exit_handle",
+        "_exit_handlers",
+        "_reasons_cache",
+        "_state",
+        "_triggers",
+    )
+
     def __init__(self, *triggers: Trigger) -> None:
         self._triggers = triggers
         self._current_task: asyncio.Task[Any] | None = None
-        self._exit_handlers: list[TriggerHandle] = []
-        self._cancel_reasons: list[CancelReason] = []
+        self._exit_handle: TriggerHandle | None = None
+        self._exit_handlers: list[TriggerHandle] | None = None
+        self._cancel_reasons: list[CancelReason] | None = None
+        self._reasons_cache: tuple[CancelReason, ...] | None = None
         self._cancel_token: _CancelToken | None = None
         self._cancelling: int | None = None
-        self._armed = False
-        self._exited = False
+        self._state = 0
 
     @property
     def cancelled(self) -> bool:
-        return len(self._cancel_reasons) > 0
+        return self._cancel_reasons is not None
 
     @property
     def reasons(self) -> tuple[CancelReason, ...]:
-        return tuple(self._cancel_reasons)
+        if self._reasons_cache is None:
+            if self._cancel_reasons is None:
+                return ()
+            self._reasons_cache = tuple(self._cancel_reasons)
+        return self._reasons_cache
 
     def cancelled_by(self, code: str) -> bool:
+        if self._cancel_reasons is None:
+            return False
         return any(r.code == code for r in self._cancel_reasons)
 
     def __enter__(self) -> Self:
-        if self._exited or self._current_task is not None:
+        if self._state:
             raise RuntimeError("Fence cannot be reused")
+        self._state = _ENTERED
+        if not self._triggers:
+            return self
 
-        task = asyncio.current_task()
+        task = current_task()
         assert task is not None  # noqa: S101
         self._current_task = task
         self._cancelling = task.cancelling()
 
+        if len(self._triggers) == 1:
+            return self._enter_single(self._triggers[0])
+
         for source in self._triggers:
             reason = source.check()
-            if reason is not None:
+            if reason is None:
+                continue
+            if self._cancel_reasons is None:
+                self._cancel_reasons = [reason]
+            else:
                 self._cancel_reasons.append(reason)
 
-        if self._cancel_reasons:
+        if self._cancel_reasons is not None:
             # 3.12: uncancel() doesn't clear _must_cancel, so calling
             # task.cancel() synchronously here would cause a spurious
             # CancelledError at the next await. Defer via call_soon so
@@ -115,8 +155,7 @@ class Fence:
             self._schedule_cancel()
             return self
 
-        self._exit_handlers = [source.arm(self._on_trigger) for source in self._triggers]
-        self._armed = True
+        self._exit_handlers = self._arm_all()
         return self
 
     def __exit__(
@@ -125,18 +164,51 @@ class Fence:
         exc_val: BaseException | None,
         exc_tb: object,
     ) -> bool:
-        self._exited = True
-        if self._armed:
+        self._state |= _EXITED
+        handle = self._exit_handle
+        if handle is not None:
+            handle.disarm()
+        elif self._exit_handlers is not None:
             for guard in self._exit_handlers:
                 guard.disarm()
 
-        if self._cancel_token is None:
+        token = self._cancel_token
+        if token is None:
             return False
 
-        return self._cancel_token.resolve(exc_type)
+        return token.resolve(exc_type)
+
+    def _enter_single(self, trigger: Trigger) -> Self:
+        reason = trigger.check()
+        if reason is not None:
+            self._cancel_reasons = [reason]
+            self._schedule_cancel()
+            return self
+
+        self._exit_handle = trigger.arm(self._on_trigger)
+        return self
+
+    def _arm_all(self) -> list[TriggerHandle]:
+        on_trigger = self._on_trigger
+        handlers: list[TriggerHandle] = []
+        try:
+            for source in self._triggers:
+                handle = source.arm(on_trigger)
+                handlers.append(handle)
+        except BaseException:
+            # __exit__ never runs if __enter__ raises — release what was armed
+            for handle in handlers:
+                handle.disarm()
+            raise
+
+        return handlers
 
     def _on_trigger(self, reason: CancelReason) -> None:
-        self._cancel_reasons.append(reason)
+        if self._cancel_reasons is None:
+            self._cancel_reasons = [reason]
+        else:
+            self._cancel_reasons.append(reason)
+            self._reasons_cache = None
         self._cancel()
 
     def _cancel(self) -> None:
@@ -148,30 +220,31 @@ class Fence:
         if self._cancel_token is not None:
             return
 
-        if asyncio.current_task() is self._current_task:
+        if current_task() is self._current_task:
             raise asyncio.InvalidStateError(
                 "Trigger callback fired synchronously inside the task. "
                 "Trigger.arm() callbacks must fire from the event loop, not inline."
             )
 
-        task, cancelling = self._cancel_preconditions()
-        self._cancel_token = _CancelToken.cancel(task, self._cancel_reasons[0].message, cancelling)
+        # only reachable from handles armed in __enter__, so state is set
+        task, cancelling, reasons = self._current_task, self._cancelling, self._cancel_reasons
+        assert task is not None  # noqa: S101
+        assert cancelling is not None  # noqa: S101
+        assert reasons is not None  # noqa: S101
+        self._cancel_token = _CancelToken.cancel(task, reasons[0].message, cancelling)
 
     def _schedule_cancel(self) -> None:
         """
         Defers task.cancel() via call_soon. Used from __enter__ (pre-trigger
         path) to avoid setting _must_cancel during synchronous execution.
         """
-        task, cancelling = self._cancel_preconditions()
-        self._cancel_token = _CancelToken.schedule_cancel(
-            task, self._cancel_reasons[0].message, cancelling
-        )
-
-    def _cancel_preconditions(self) -> tuple[asyncio.Task[Any], int]:
-        if self._current_task is None or self._cancelling is None:
-            raise RuntimeError("Fence._cancel() called before __enter__")
+        task, cancelling, reasons = self._current_task, self._cancelling, self._cancel_reasons
+        if task is None or cancelling is None or reasons is None:
+            raise RuntimeError(
+                "Fence._schedule_cancel() called before __enter__ or without a reason"
+            )
 
-        return self._current_task, self._cancelling
+        self._cancel_token = _CancelToken.schedule_cancel(task, reasons[0].message, cancelling)
 
 
 class _CancelToken:
@@ -182,6 +255,8 @@ class _CancelToken:
     when called from within the task's own synchronous execution.
     """
 
+    __slots__ = ("_cancelling", "_delivered", "_handle", "_task")
+
     def __init__(
         self,
         task: asyncio.Task[Any],
@@ -200,7 +275,7 @@ class _CancelToken:
         cancelling: int,
     ) -> _CancelToken:
         token = cls(task, cancelling)
-        token._handle = asyncio.get_running_loop().call_soon(token._deliver_cancellation, msg)
+        token._handle = get_running_loop().call_soon(token._deliver_cancellation, msg)
         return token
 
     @classmethod
@@ -231,13 +306,11 @@ class _CancelToken:
 
         remaining = self._task.uncancel()
         # suppress our CancelledError, propagate everything else
-        return (
-            remaining <= self._cancelling
-            and exc_type is not None
-            and issubclass(exc_type, asyncio.CancelledError)
-        )
+        if remaining > self._cancelling or exc_type is None:
+            return False
+        return exc_type is CancelledError or issubclass(exc_type, CancelledError)
 
     def _deliver_cancellation(self, msg: str) -> None:
         self._delivered = True
         self._handle = None
-        self._task.cancel(msg=msg)
+        self._task.cancel(msg)
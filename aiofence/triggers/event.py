@@ -1,5 +1,6 @@
 import asyncio
-from asyncio import Event
+from asyncio import Event, get_running_loop
+from collections.abc import Callable
 from contextlib import suppress
 
 from aiofence.core import (
@@ -12,36 +13,47 @@ from aiofence.core import (
 
 
 class EventTrigger(Trigger):
+    __slots__ = ("_code", "_event", "_waiters_append")
+
     def __init__(self, event: Event, *, code: str | None = None) -> None:
         self._event = event
         self._code = code
-
-    def _reason(self) -> CancelReason:
-        return CancelReason(
-            message=f"event {self._event!r} triggered",
-            cancel_type=CancelType.EVENT,
-            code=self._code,
-        )
+        self._waiters_append = event._waiters.append
 
     def check(self) -> CancelReason | None:
         if self._event.is_set():
-            return self._reason()
+            return self._make_reason()
         return None
 
     def arm(self, on_cancel: CancelCallback) -> TriggerHandle:
-        loop = asyncio.get_running_loop()
-        fut = loop.create_future()
-        reason = self._reason()
-        handle = EventHandle(self._event, fut)
-        fut.add_done_callback(lambda _: on_cancel(reason) if not handle.disarmed else None)
-        self._event._waiters.append(fut)
+        fut = get_running_loop().create_future()
+        handle = EventHandle(self._event, fut, on_cancel, self._make_reason)
+        fut.add_done_callback(handle._fire)
+        self._waiters_append(fut)
         return handle
 
+    def _make_reason(self) -> CancelReason:
+        return CancelReason(
+            message=f"event {self._event!r} triggered",
+            cancel_type=CancelType.EVENT,
+            code=self._code,
+        )
+
 
 class EventHandle(TriggerHandle):
-    def __init__(self, event: Event, fut: asyncio.Future[None]) -> None:
+    __slots__ = ("_disarmed", "_event", "_fut", "_make_reason", "_on_cancel")
+
+    def __init__(
+        self,
+        event: Event,
+        fut: asyncio.Future[None],
+        on_cancel: CancelCallback,
+        make_reason: Callable[[], CancelReason],
+    ) -> None:
         self._event = event
         self._fut = fut
+        self._on_cancel = on_cancel
+        self._make_reason = make_reason
         self._disarmed = False
 
     @property
@@ -50,9 +62,19 @@ class EventHandle(TriggerHandle):
 
     def disarm(self) -> None:
         self._disarmed = True
-        # Event.set() resolves futures but doesn't remove them from _waiters
-        with suppress(ValueError):
-            self._event._waiters.remove(self._fut)
+        # Event.set() resolves futures but doesn't remove them from _waiters.
+        # Nested and sequential fences disarm in LIFO order, so the tail
+        # check avoids the linear scan in the common case.
+        waiters = self._event._waiters
+        if waiters and waiters[-1] is self._fut:
+            waiters.pop()
+        else:
+            with suppress(ValueError):
+                waiters.remove(self._fut)
 
         if not self._fut.done():
             self._fut.cancel()
+
+    def _fire(self, _: asyncio.Future[None]) -> None:
+        if not self._disarmed:
+            self._on_cancel(self._make_reason())
@@ -1,4 +1,5 @@
 import asyncio
+from asyncio import get_running_loop
 
 from aiofence.core import (
     CancelCallback,
@@ -10,6 +11,8 @@ from aiofence.core import (
 
 
 class TimeoutHandle(TriggerHandle):
+    __slots__ = ("_handle",)
+
     def __init__(self, handle: asyncio.TimerHandle) -> None:
         self._handle = handle
 
@@ -18,27 +21,21 @@ class TimeoutHandle(TriggerHandle):
 
 
 class TimeoutTrigger(Trigger):
+    __slots__ = ("_delay", "_reason")
+
     def __init__(self, delay: float, *, code: str | None = None) -> None:
         self._delay = delay
-        self._code = code
-
-    def _reason(self) -> CancelReason:
-        return CancelReason(
-            message=f"timed out after {self._delay}s",
+        self._reason = CancelReason(
+            message=f"timed out after {delay}s",
             cancel_type=CancelType.TIMEOUT,
-            code=self._code,
+            code=code,
         )
 
     def check(self) -> CancelReason | None:
         if self._delay <= 0:
-            return self._reason()
+            return self._reason
         return None
 
     def arm(self, on_cancel: CancelCallback) -> TriggerHandle:
-        loop = asyncio.get_running_loop()
-        handle = loop.call_at(
-            loop.time() + self._delay,
-            on_cancel,
-            self._reason(),
-        )
+        handle = get_running_loop().call_later(self._delay, on_cancel, self._reason)
         return TimeoutHandle(handle)
@@ -1,4 +1,6 @@
 import asyncio
+import selectors
+from collections.abc import AsyncIterator, Awaitable, Callable
 
 import pytest
 
@@ -13,7 +15,87 @@ def event_loop_policy(request: pytest.FixtureRequest) -> asyncio.AbstractEventLo
         import uvloop
 
         return uvloop.EventLoopPolicy()
-    return asyncio.DefaultEventLoopPolicy()
+    return _VirtualTimeLoopPolicy()
+
+
+class _FastForwardSelector(selectors.DefaultSelector):
+    """
+    Polls without blocking and, once the loop runs on virtual time, advances
+    its clock by the timeout instead of sleeping through it.
+    """
+
+    def __init__(self, loop: "_VirtualTimeLoop") -> None:
+        super().__init__()
+        self._loop = loop
+
+    def select(self, timeout: float | None = None) -> list[tuple[selectors.SelectorKey, int]]:
+        if timeout is None or not self._loop.virtual:
+            return super().select(timeout)
+
+        events = super().select(0)
+        if not events:
+            self._loop.advance(timeout)
+        return events
+
+
+class _VirtualTimeLoop(asyncio.SelectorEventLoop):
+    """
+    Event loop that runs on the real clock until switched to virtual time.
+
+    On virtual time the clock jumps to the next scheduled timer whenever no
+    I/O is ready, so timeouts and sleeps fire without real waiting. Work
+    outside the loop — threads, sockets, subprocesses — is not waited for,
+    so only switch for tests driven purely by loop timers.
+    """
+
+    def __init__(self) -> None:
+        self._virtual_time: float | None = None
+        super().__init__(_FastForwardSelector(self))
+
+    @property
+    def virtual(self) -> bool:
+        return self._virtual_time is not None
+
+    def time(self) -> float:
+        if self._virtual_time is None:
+            return super().time()
+        return self._virtual_time
+
+    def use_virtual_time(self) -> None:
+        self._virtual_time = super().time()
+
+    def use_real_time(self) -> None:
+        self._virtual_time = None
+
+    def advance(self, seconds: float) -> None:
+        assert self._virtual_time is not None
+        self._virtual_time += seconds
+
+
+class _VirtualTimeLoopPolicy(asyncio.DefaultEventLoopPolicy):
+    def new_event_loop(self) -> asyncio.AbstractEventLoop:
+        return _VirtualTimeLoop()
+
+
+@pytest.fixture
+async def virtual_clock() -> AsyncIterator[None]:
+    loop = asyncio.get_running_loop()
+    if not isinstance(loop, _VirtualTimeLoop):
+        yield
+        return
+
+    loop.use_virtual_time()
+    yield
+    loop.use_real_time()
+
+
+@pytest.fixture
+def never() -> Callable[[], Awaitable[None]]:
+    return _never
+
+
+async def _never() -> None:
+    await asyncio.get_running_loop().create_future()
 
 
 def _active_handles(loop: asyncio.AbstractEventLoop) -> int:
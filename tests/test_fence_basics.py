@@ -1,4 +1,5 @@
 import asyncio
+import weakref
 
 import pytest
 
@@ -19,6 +20,14 @@ async def test__fence__when_no_sources_sync__then_protocol_intact():
     assert not fence.cancelled
 
 
+async def test__fence__when_not_cancelled__then_reasons_empty():
+    with Fence(TimeoutTrigger(1)) as fence:
+        await asyncio.sleep(0)
+
+    assert fence.reasons == ()
+    assert not fence.cancelled_by("anything")
+
+
 async def test__fence__when_zero_timeout__then_body_interrupted_at_await():
     reached_before_await = False
     reached_after_await = False
@@ -63,3 +72,15 @@ async def test__fence__cancel_before_enter__then_raises():
     fence = Fence()
     with pytest.raises(RuntimeError, match="before __enter__"):
         fence._schedule_cancel()
+
+
+def test__fence__when_constructed__then_has_no_instance_dict():
+    fence = Fence(TimeoutTrigger(1))
+
+    assert not hasattr(fence, "__dict__")
+
+
+def test__fence__when_constructed__then_weakly_referenceable():
+    fence = Fence(TimeoutTrigger(1))
+
+    assert weakref.ref(fence)() is fence
@@ -4,35 +4,37 @@ import pytest
 
 from aiofence import EventTrigger, Fence, TimeoutTrigger
 
+pytestmark = pytest.mark.usefixtures("virtual_clock")
+
 # --- Nested fences ---
 
 
-async def test__fence__when_inner_timeout_fires__then_outer_unaffected():
+async def test__fence__when_inner_timeout_fires__then_outer_unaffected(never):
     outer = Fence(TimeoutTrigger(10))
     inner = Fence(TimeoutTrigger(0.001))
 
     with outer:
         with inner:
-            await asyncio.sleep(1)
+            await never()
 
     assert inner.cancelled
     assert not outer.cancelled
 
 
-async def test__fence__when_outer_timeout_fires__then_inner_doesnt_claim():
+async def test__fence__when_outer_timeout_fires__then_inner_doesnt_claim(never):
     event = asyncio.Event()  # never fires
     outer = Fence(TimeoutTrigger(0.01))
     inner = Fence(EventTrigger(event))
 
     with outer:
         with inner:
-            await asyncio.sleep(1)
+            await never()
 
     assert outer.cancelled
     assert not inner.cancelled
 
 
-async def test__fence__when_deeply_nested__then_all_counters_balanced():
+async def test__fence__when_deeply_nested__then_all_counters_balanced(never):
     task = asyncio.current_task()
     outer = Fence(TimeoutTrigger(10))
     middle = Fence(TimeoutTrigger(10))
@@ -41,7 +43,7 @@ async def test__fence__when_deeply_nested__then_all_counters_balanced():
     with outer:
         with middle:
             with inner:
-                await asyncio.sleep(1)
+                await never()
 
     assert inner.cancelled
     assert not middle.cancelled
@@ -49,17 +51,17 @@ async def test__fence__when_deeply_nested__then_all_counters_balanced():
     assert task.cancelling() == 0
 
 
-async def test__fence__when_inner_fence_inside_asyncio_timeout__then_both_independent():
+async def test__fence__when_inner_fence_inside_asyncio_timeout__then_both_independent(never):
     with pytest.raises(TimeoutError):
         async with asyncio.timeout(0.05):
             inner = Fence(TimeoutTrigger(0.001))
             with inner:
-                await asyncio.sleep(1)
+                await never()
             assert inner.cancelled
-            await asyncio.sleep(1)  # outer timeout fires here
+            await never()  # outer timeout fires here
 
 
-async def test__fence__when_nested_fences_share_same_event__then_both_cancelled():
+async def test__fence__when_nested_fences_share_same_event__then_both_cancelled(never):
     event = asyncio.Event()
     outer = Fence(EventTrigger(event))
     inner = Fence(EventTrigger(event))
@@ -69,7 +71,7 @@ async def test__fence__when_nested_fences_share_same_event__then_both_cancelled(
     with outer:
         with inner:
             event.set()
-            await asyncio.sleep(1)
+            await never()
             reached_after_await = True
         reached_after_inner = True
 
@@ -82,14 +84,14 @@ async def test__fence__when_nested_fences_share_same_event__then_both_cancelled(
 # --- External cancellation interop ---
 
 
-async def test__fence__when_external_cancel__then_propagates():
+async def test__fence__when_external_cancel__then_propagates(never):
     event = asyncio.Event()  # never fires
     reached_after_fence = False
 
     async def task_body():
         nonlocal reached_after_fence
         with Fence(EventTrigger(event)):
-            await asyncio.sleep(10)
+            await never()
         reached_after_fence = True
 
     task = asyncio.get_running_loop().create_task(task_body())
@@ -104,7 +106,7 @@ async def test__fence__when_external_cancel__then_propagates():
     assert task.cancelling() == 1  # external cancel was never uncancelled
 
 
-async def test__fence__when_external_and_trigger_both_fire__then_external_propagates():
+async def test__fence__when_external_and_trigger_both_fire__then_external_propagates(never):
     fence_cancelled = None
 
     async def task_body():
@@ -112,12 +114,13 @@ async def test__fence__when_external_and_trigger_both_fire__then_external_propag
         fence = Fence(TimeoutTrigger(0))
         try:
             with fence:
-                await asyncio.sleep(10)
+                await never()
         finally:
             fence_cancelled = fence.cancelled
 
-    task = asyncio.get_running_loop().create_task(task_body())
-    asyncio.get_running_loop().call_soon(task.cancel)
+    loop = asyncio.get_running_loop()
+    task = loop.create_task(task_body())
+    loop.call_soon(task.cancel)
 
     with pytest.raises(asyncio.CancelledError):
         await task
@@ -127,7 +130,7 @@ async def test__fence__when_external_and_trigger_both_fire__then_external_propag
     assert fence_cancelled  # fence's trigger also fired
 
 
-async def test__fence__when_external_cancel_with_nested_fences__then_propagates():
+async def test__fence__when_external_cancel_with_nested_fences__then_propagates(never):
     event1 = asyncio.Event()  # never fires
     event2 = asyncio.Event()  # never fires
     outer_cancelled = None
@@ -141,7 +144,7 @@ async def test__fence__when_external_cancel_with_nested_fences__then_propagates(
         try:
             with outer:
                 with inner:
-                    await asyncio.sleep(10)
+                    await never()
                 reached_after_inner = True
         finally:
             outer_cancelled = outer.cancelled
@@ -201,39 +204,39 @@ async def test__fence__when_child_task_cancelled_inside_body__then_fence_unaffec
 # --- asyncio.timeout interop ---
 
 
-async def test__fence__when_asyncio_timeout_nested_inside__then_timeout_raises():
+async def test__fence__when_asyncio_timeout_nested_inside__then_timeout_raises(never):
     event = asyncio.Event()  # never fires
 
     with Fence(EventTrigger(event)) as fence:
         with pytest.raises(TimeoutError):
             async with asyncio.timeout(0.001):
-                await asyncio.sleep(10)
+                await never()
 
     assert not fence.cancelled
 
 
-async def test__fence__when_asyncio_timeout_zero_nested_inside__then_timeout_raises():
+async def test__fence__when_asyncio_timeout_zero_nested_inside__then_timeout_raises(never):
     event = asyncio.Event()  # never fires
 
     with pytest.raises(TimeoutError):
         with Fence(EventTrigger(event)) as fence:
             async with asyncio.timeout(0):
-                await asyncio.sleep(10)
+                await never()
 
     assert not fence.cancelled
 
 
-async def test__fence__when_nested_inside_asyncio_timeout__then_timeout_propagates():
+async def test__fence__when_nested_inside_asyncio_timeout__then_timeout_propagates(never):
     with pytest.raises(TimeoutError):
         async with asyncio.timeout(0.05):
             with Fence(TimeoutTrigger(0)) as fence:
-                await asyncio.sleep(10)
-            await asyncio.sleep(10)  # outer timeout fires here
+                await never()
+            await never()  # outer timeout fires here
 
     assert fence.cancelled
 
 
-async def test__fence__when_prior_uncancel_cycle__then_counter_survives():
+async def test__fence__when_prior_uncancel_cycle__then_counter_survives(never):
     fence_cancelled = None
 
     async def run():
@@ -241,12 +244,12 @@ async def test__fence__when_prior_uncancel_cycle__then_counter_survives():
         task = asyncio.current_task()
 
         try:
-            await asyncio.sleep(10)
+            await never()
         except asyncio.CancelledError:
             task.uncancel()
 
         with Fence(TimeoutTrigger(0)) as fence:
-            await asyncio.sleep(10)
+            await never()
 
         fence_cancelled = fence.cancelled
         assert task.cancelling() == 0
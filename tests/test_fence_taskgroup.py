@@ -4,18 +4,18 @@ import pytest
 
 from aiofence import EventTrigger, Fence, TimeoutTrigger
 
+pytestmark = pytest.mark.usefixtures("virtual_clock")
+
 # --- Fence inside TaskGroup body ---
 
 
-async def test__fence__when_trigger_fires_in_tg_body__then_tg_exits_normally():
+async def test__fence__when_trigger_fires_in_tg_body__then_tg_exits_normally(never):
     result = None
 
-    async with asyncio.TaskGroup() as tg:
-        tg.create_task(asyncio.sleep(0))  # dummy child
-
+    async with asyncio.TaskGroup():
         fence = Fence(TimeoutTrigger(0.001))
         with fence:
-            await asyncio.sleep(1)
+            await never()
 
         result = "continued"
 
@@ -23,15 +23,13 @@ async def test__fence__when_trigger_fires_in_tg_body__then_tg_exits_normally():
     assert result == "continued"
 
 
-async def test__fence__when_pretriggered_in_tg_body__then_tg_exits_normally():
+async def test__fence__when_pretriggered_in_tg_body__then_tg_exits_normally(never):
     result = None
 
-    async with asyncio.TaskGroup() as tg:
-        tg.create_task(asyncio.sleep(0))
-
+    async with asyncio.TaskGroup():
         fence = Fence(TimeoutTrigger(0))
         with fence:
-            await asyncio.sleep(1)
+            await never()
 
         result = "continued"
 
@@ -42,14 +40,14 @@ async def test__fence__when_pretriggered_in_tg_body__then_tg_exits_normally():
 # --- Fence inside child task ---
 
 
-async def test__fence__when_trigger_fires_in_child_task__then_tg_unaffected():
+async def test__fence__when_trigger_fires_in_child_task__then_tg_unaffected(never):
     child_result = None
 
     async def child():
         nonlocal child_result
         fence = Fence(TimeoutTrigger(0.001))
         with fence:
-            await asyncio.sleep(1)
+            await never()
         child_result = fence.cancelled
 
     async with asyncio.TaskGroup() as tg:
@@ -58,7 +56,7 @@ async def test__fence__when_trigger_fires_in_child_task__then_tg_unaffected():
     assert child_result is True
 
 
-async def test__fence__when_child_fails_while_another_fenced__then_yields_to_tg():
+async def test__fence__when_child_fails_while_another_fenced__then_yields_to_tg(never):
     fence_cancelled = None
     fence_suppressed = None
 
@@ -66,7 +64,7 @@ async def test__fence__when_child_fails_while_another_fenced__then_yields_to_tg(
         nonlocal fence_cancelled, fence_suppressed
         fence = Fence(EventTrigger(asyncio.Event()))  # never fires
         with fence:
-            await asyncio.sleep(10)
+            await never()
         fence_cancelled = fence.cancelled
         fence_suppressed = True  # should not reach
 
@@ -84,7 +82,7 @@ async def test__fence__when_child_fails_while_another_fenced__then_yields_to_tg(
     assert fence_suppressed is None
 
 
-async def test__fence__when_child_fails_while_body_fenced__then_yields_to_tg():
+async def test__fence__when_child_fails_while_body_fenced__then_yields_to_tg(never):
     fence_cancelled = None
     reached_after_fence = False
 
@@ -98,7 +96,7 @@ async def test__fence__when_child_fails_while_body_fenced__then_yields_to_tg():
 
             fence = Fence(EventTrigger(asyncio.Event()))  # never fires
             with fence:
-                await asyncio.sleep(10)
+                await never()
             reached_after_fence = True
             fence_cancelled = fence.cancelled
 
@@ -107,7 +105,7 @@ async def test__fence__when_child_fails_while_body_fenced__then_yields_to_tg():
     assert fence_cancelled is None  # never reached
 
 
-async def test__fence__when_trigger_fires_during_tg_teardown__then_yields_to_tg():
+async def test__fence__when_trigger_fires_during_tg_teardown__then_yields_to_tg(never):
     cancel_event = asyncio.Event()
     fence_cancelled = None
 
@@ -123,7 +121,7 @@ async def test__fence__when_trigger_fires_during_tg_teardown__then_yields_to_tg(
             fence = Fence(EventTrigger(cancel_event))
             try:
                 with fence:
-                    await asyncio.sleep(10)
+                    await never()
             finally:
                 fence_cancelled = fence.cancelled
 
@@ -131,14 +129,14 @@ async def test__fence__when_trigger_fires_during_tg_teardown__then_yields_to_tg(
     assert fence_cancelled is True  # trigger fired, but Fence yielded to TG
 
 
-async def test__fence__when_outer_fence_wraps_tg_with_inner_fence__then_independent():
+async def test__fence__when_outer_fence_wraps_tg_with_inner_fence__then_independent(never):
     inner_cancelled = None
 
     async def child():
         nonlocal inner_cancelled
         inner = Fence(TimeoutTrigger(0.001))
         with inner:
-            await asyncio.sleep(1)
+            await never()
         inner_cancelled = inner.cancelled
 
     outer = Fence(EventTrigger(asyncio.Event()))  # never fires
@@ -181,13 +179,13 @@ async def test__fence__when_tg_child_fails_inside_fence__then_excgroup_propagate
     assert not fence.cancelled
 
 
-async def test__fence__when_trigger_fires_while_tg_active__then_fence_suppresses():
+async def test__fence__when_trigger_fires_while_tg_active__then_fence_suppresses(never):
     child_was_cancelled = None
 
     async def long_child():
         nonlocal child_was_cancelled
         try:
-            await asyncio.sleep(10)
+            await never()
         except asyncio.CancelledError:
             child_was_cancelled = True
             raise
@@ -204,14 +202,14 @@ async def test__fence__when_trigger_fires_while_tg_active__then_fence_suppresses
     assert child_was_cancelled is True
 
 
-async def test__fence__when_tg_externally_cancelled_with_body_fenced__then_propagates():
+async def test__fence__when_tg_externally_cancelled_with_body_fenced__then_propagates(never):
     fence_cancelled = None
     child_was_cancelled = None
 
     async def long_child():
         nonlocal child_was_cancelled
         try:
-            await asyncio.sleep(10)
+            await never()
         except asyncio.CancelledError:
             child_was_cancelled = True
             raise
@@ -223,7 +221,7 @@ async def test__fence__when_tg_externally_cancelled_with_body_fenced__then_propa
             with fence:
                 async with asyncio.TaskGroup() as tg:
                     tg.create_task(long_child())
-                    await asyncio.sleep(10)
+                    await never()
         finally:
             fence_cancelled = fence.cancelled
 
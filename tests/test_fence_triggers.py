@@ -1,28 +1,31 @@
 import asyncio
+import weakref
 
 import pytest
 
 from aiofence import EventTrigger, Fence, TimeoutTrigger
 from aiofence.core import CancelCallback, CancelReason, CancelType, Trigger, TriggerHandle
 
+pytestmark = pytest.mark.usefixtures("virtual_clock")
+
 # --- Pre-triggered ---
 
 
-async def test__fence__when_timeout_pre_triggered__then_suppressed_with_reasons():
+async def test__fence__when_timeout_pre_triggered__then_suppressed_with_reasons(never):
     with Fence(TimeoutTrigger(0)) as fence:
-        await asyncio.sleep(1)
+        await never()
 
     assert fence.cancelled
     assert len(fence.reasons) == 1
     assert fence.reasons[0].cancel_type is CancelType.TIMEOUT
 
 
-async def test__fence__when_event_pre_set__then_suppressed_and_cancelled():
+async def test__fence__when_event_pre_set__then_suppressed_and_cancelled(never):
     event = asyncio.Event()
     event.set()
 
     with Fence(EventTrigger(event)) as fence:
-        await asyncio.sleep(1)
+        await never()
 
     assert fence.cancelled
     assert fence.reasons[0].cancel_type is CancelType.EVENT
@@ -44,6 +47,34 @@ async def test__fence__when_event_pre_set__then_body_interrupted_at_await():
     assert not reached_after_await
 
 
+async def test__fence__when_event_set_after_trigger_built__then_message_shows_set_event(never):
+    event = asyncio.Event()
+    trigger = EventTrigger(event)
+    event.set()
+
+    with Fence(trigger) as fence:
+        await never()
+
+    assert fence.reasons[0].message == f"event {event!r} triggered"
+    assert "[set" in fence.reasons[0].message
+
+
+async def test__fence__when_trigger_reused__then_message_reflects_current_event(never):
+    event = asyncio.Event()
+    trigger = EventTrigger(event)
+
+    with Fence(trigger) as first:
+        with Fence(trigger):
+            event.set()
+            await never()
+
+    with Fence(trigger) as second:
+        await never()
+
+    assert first.reasons[0].message != second.reasons[0].message
+    assert second.reasons[0].message == f"event {event!r} triggered"
+
+
 async def test__fence__when_event_pre_set_sync_body__then_body_completes():
     event = asyncio.Event()
     event.set()
@@ -56,34 +87,55 @@ async def test__fence__when_event_pre_set_sync_body__then_body_completes():
     assert reached
 
 
+async def test__fence__when_multiple_triggers_pre_triggered__then_all_reasons_recorded(never):
+    event = asyncio.Event()
+    event.set()
+
+    with Fence(TimeoutTrigger(0, code="budget"), EventTrigger(event, code="shutdown")) as fence:
+        await never()
+
+    assert fence.cancelled_by("budget")
+    assert fence.cancelled_by("shutdown")
+
+
 # --- Runtime trigger fire (not pre-set) ---
 
 
-async def test__fence__when_event_set_during_body__then_suppressed():
+async def test__fence__when_event_set_during_body__then_suppressed(never):
     event = asyncio.Event()
     asyncio.get_running_loop().call_soon(event.set)
 
     with Fence(EventTrigger(event)) as fence:
-        await asyncio.sleep(1)
+        await never()
 
     assert fence.cancelled
 
 
-async def test__fence__when_timeout_fires__then_suppressed_with_reasons():
+async def test__fence__when_event_set_during_body__then_message_shows_set_event(never):
+    event = asyncio.Event()
+    asyncio.get_running_loop().call_soon(event.set)
+
+    with Fence(EventTrigger(event)) as fence:
+        await never()
+
+    assert "[set" in fence.reasons[0].message
+
+
+async def test__fence__when_timeout_fires__then_suppressed_with_reasons(never):
     with Fence(TimeoutTrigger(0.001)) as fence:
-        await asyncio.sleep(1)
+        await never()
 
     assert fence.cancelled
     assert len(fence.reasons) == 1
     assert fence.reasons[0].cancel_type is CancelType.TIMEOUT
 
 
-async def test__fence__when_body_catches_cancelled_error__then_counter_balanced():
+async def test__fence__when_body_catches_cancelled_error__then_counter_balanced(never):
     task = asyncio.current_task()
 
     with Fence(TimeoutTrigger(0.001)) as fence:
         try:
-            await asyncio.sleep(1)
+            await never()
         except asyncio.CancelledError:
             pass
 
@@ -91,13 +143,13 @@ async def test__fence__when_body_catches_cancelled_error__then_counter_balanced(
     assert task.cancelling() == 0
 
 
-async def test__fence__when_trigger_fires_and_body_raises__then_exception_propagates():
+async def test__fence__when_trigger_fires_and_body_raises__then_exception_propagates(never):
     task = asyncio.current_task()
 
     with pytest.raises(ValueError, match="boom"):
         with Fence(TimeoutTrigger(0.001)) as fence:
             try:
-                await asyncio.sleep(1)
+                await never()
             except asyncio.CancelledError:
                 raise ValueError("boom") from None
 
@@ -105,13 +157,13 @@ async def test__fence__when_trigger_fires_and_body_raises__then_exception_propag
     assert task.cancelling() == 0
 
 
-async def test__fence__when_trigger_fires_and_finally_raises__then_exception_propagates():
+async def test__fence__when_trigger_fires_and_finally_raises__then_exception_propagates(never):
     task = asyncio.current_task()
 
     with pytest.raises(ValueError, match="boom"):
         with Fence(TimeoutTrigger(0.001)) as fence:
             try:
-                await asyncio.sleep(1)
+                await never()
             finally:
                 raise ValueError("boom")
 
@@ -119,12 +171,12 @@ async def test__fence__when_trigger_fires_and_finally_raises__then_exception_pro
     assert task.cancelling() == 0
 
 
-async def test__fence__when_user_uncancels_inside_body__then_counter_balanced():
+async def test__fence__when_user_uncancels_inside_body__then_counter_balanced(never):
     task = asyncio.current_task()
 
     with Fence(TimeoutTrigger(0.001)) as fence:
         try:
-            await asyncio.sleep(1)
+            await never()
         except asyncio.CancelledError:
             task.uncancel()
 
@@ -135,9 +187,9 @@ async def test__fence__when_user_uncancels_inside_body__then_counter_balanced():
 # --- Edge cases ---
 
 
-async def test__fence__when_negative_timeout__then_suppressed():
+async def test__fence__when_negative_timeout__then_suppressed(never):
     with Fence(TimeoutTrigger(-1)) as fence:
-        await asyncio.sleep(1)
+        await never()
 
     assert fence.cancelled
     assert fence.reasons[0].cancel_type is CancelType.TIMEOUT
@@ -178,45 +230,45 @@ async def test__fence__when_event_set_inside_body__then_no_spurious_cancel_after
     assert asyncio.current_task().cancelling() == 0
 
 
-async def test__fence__when_event_has_code__then_reason_carries_code():
+async def test__fence__when_event_has_code__then_reason_carries_code(never):
     event = asyncio.Event()
-    asyncio.get_running_loop().call_soon(event.set)
+    event.set()
 
     with Fence(EventTrigger(event, code="shutdown")) as fence:
-        await asyncio.sleep(1)
+        await never()
 
     assert fence.cancelled
     assert fence.reasons[0].code == "shutdown"
 
 
-async def test__fence__when_timeout_has_code__then_reason_carries_code():
+async def test__fence__when_timeout_has_code__then_reason_carries_code(never):
     with Fence(TimeoutTrigger(0, code="request_budget")) as fence:
-        await asyncio.sleep(1)
+        await never()
 
     assert fence.cancelled
     assert fence.reasons[0].code == "request_budget"
 
 
-async def test__fence__when_no_code__then_reason_code_is_none():
+async def test__fence__when_no_code__then_reason_code_is_none(never):
     with Fence(TimeoutTrigger(0)) as fence:
-        await asyncio.sleep(1)
+        await never()
 
     assert fence.cancelled
     assert fence.reasons[0].code is None
 
 
-async def test__fence__cancelled_by__when_code_matches__then_true():
+async def test__fence__cancelled_by__when_code_matches__then_true(never):
     event = asyncio.Event()
-    asyncio.get_running_loop().call_soon(event.set)
+    event.set()
 
     with Fence(EventTrigger(event, code="disconnect")) as fence:
-        await asyncio.sleep(1)
+        await never()
 
     assert fence.cancelled_by("disconnect")
     assert not fence.cancelled_by("shutdown")
 
 
-async def test__fence__cancelled_by__when_multiple_triggers__then_matches_any():
+async def test__fence__cancelled_by__when_multiple_triggers__then_matches_any(never):
     event1 = asyncio.Event()
     event2 = asyncio.Event()
 
@@ -225,7 +277,7 @@ async def test__fence__cancelled_by__when_multiple_triggers__then_matches_any():
     ) as fence:
         event1.set()
         event2.set()
-        await asyncio.sleep(1)
+        await never()
 
     assert fence.cancelled_by("shutdown")
     assert fence.cancelled_by("disconnect")
@@ -239,19 +291,42 @@ async def test__fence__cancelled_by__when_not_cancelled__then_false():
     assert not fence.cancelled_by("anything")
 
 
-async def test__fence__when_multiple_triggers_fire__then_all_reasons_recorded():
+async def test__fence__when_multiple_triggers_fire__then_all_reasons_recorded(never):
     event1 = asyncio.Event()
     event2 = asyncio.Event()
 
     with Fence(EventTrigger(event1), EventTrigger(event2)) as fence:
         event1.set()
         event2.set()
-        await asyncio.sleep(1)
+        await never()
 
     assert fence.cancelled
     assert len(fence.reasons) == 2
 
 
+async def test__fence__when_reasons_read_before_second_fire__then_second_reason_visible(never):
+    event1 = asyncio.Event()
+    event2 = asyncio.Event()
+
+    with Fence(EventTrigger(event1), EventTrigger(event2)) as fence:
+        event1.set()
+        try:
+            await never()
+        except asyncio.CancelledError:
+            assert len(fence.reasons) == 1
+            event2.set()
+            await asyncio.sleep(0)
+
+    assert len(fence.reasons) == 2
+
+
+async def test__fence__when_exited__then_reasons_tuple_reused(never):
+    with Fence(TimeoutTrigger(0)) as fence:
+        await never()
+
+    assert fence.reasons is fence.reasons
+
+
 async def test__fence__when_trigger_fires_inline__then_raises_invalid_state():
     class InlineTrigger(Trigger):
         def check(self) -> CancelReason | None:
@@ -270,7 +345,24 @@ async def test__fence__when_trigger_fires_inline__then_raises_invalid_state():
             await asyncio.sleep(0)
 
 
-async def test__fence__when_second_trigger_fires_during_cleanup__then_both_reasons_recorded():
+async def test__fence__when_arm_raises__then_already_armed_triggers_disarmed():
+    class FailingTrigger(Trigger):
+        def check(self) -> CancelReason | None:
+            return None
+
+        def arm(self, on_cancel: CancelCallback) -> TriggerHandle:  # noqa: ARG002
+            raise RuntimeError("arm failed")
+
+    event = asyncio.Event()
+
+    with pytest.raises(RuntimeError, match="arm failed"):
+        with Fence(EventTrigger(event), FailingTrigger()):
+            pass
+
+    assert len(event._waiters) == 0
+
+
+async def test__fence__when_second_trigger_fires_during_cleanup__then_both_reasons_recorded(never):
     event1 = asyncio.Event()
     event2 = asyncio.Event()
     cleanup_done = False
@@ -279,14 +371,14 @@ async def test__fence__when_second_trigger_fires_during_cleanup__then_both_reaso
         await asyncio.sleep(0.01)
         event2.set()
 
-    bg_task = asyncio.create_task(set_event2_later())  # noqa: RUF006, F841
+    bg_task = asyncio.create_task(set_event2_later())
 
     with Fence(EventTrigger(event1), EventTrigger(event2)) as fence:
         event1.set()
         try:
-            await asyncio.sleep(1)
+            await never()
         except asyncio.CancelledError:
-            await asyncio.sleep(0.05)
+            await bg_task
             cleanup_done = True
 
     assert fence.cancelled
@@ -295,7 +387,7 @@ async def test__fence__when_second_trigger_fires_during_cleanup__then_both_reaso
     assert asyncio.current_task().cancelling() == 0
 
 
-async def test__fence__when_second_trigger_fires_after_fence__then_post_fence_async_works():
+async def test__fence__when_second_trigger_fires_after_fence__then_post_fence_async_works(never):
     event1 = asyncio.Event()
     event2 = asyncio.Event()
 
@@ -303,17 +395,17 @@ async def test__fence__when_second_trigger_fires_after_fence__then_post_fence_as
         await asyncio.sleep(0.05)
         event2.set()
 
-    bg_task = asyncio.create_task(set_event2_later())  # noqa: RUF006, F841
+    bg_task = asyncio.create_task(set_event2_later())
 
     with Fence(EventTrigger(event1), EventTrigger(event2)) as fence:
         event1.set()
         try:
-            await asyncio.sleep(1)
+            await never()
         except asyncio.CancelledError:
             await asyncio.sleep(0.01)
 
     # event2 fires here, after fence exited and disarmed triggers
-    await asyncio.sleep(0.1)
+    await bg_task
     assert event1.is_set()
     assert event2.is_set()
     assert fence.cancelled
@@ -321,7 +413,7 @@ async def test__fence__when_second_trigger_fires_after_fence__then_post_fence_as
     assert asyncio.current_task().cancelling() == 0
 
 
-async def test__fence__when_event_reused_sequentially__then_waiters_clean():
+async def test__fence__when_event_reused_sequentially__then_waiters_clean(never):
     loop = asyncio.get_running_loop()
     event = asyncio.Event()
 
@@ -336,7 +428,7 @@ async def test__fence__when_event_reused_sequentially__then_waiters_clean():
     with Fence(EventTrigger(event)) as fence1:
         assert pending_waiters() == 2
         event.set()
-        await asyncio.sleep(1)
+        await never()
 
     assert fence1.cancelled
     assert pending_waiters() == 0
@@ -351,7 +443,7 @@ async def test__fence__when_event_reused_sequentially__then_waiters_clean():
     with Fence(EventTrigger(event)) as fence2:
         assert pending_waiters() == 2
         event.set()
-        await asyncio.sleep(1)
+        await never()
 
     assert fence2.cancelled
     assert pending_waiters() == 0
@@ -359,12 +451,12 @@ async def test__fence__when_event_reused_sequentially__then_waiters_clean():
     assert asyncio.current_task().cancelling() == 0
 
 
-async def test__fence__when_two_tasks_share_event__then_both_cancelled_and_waiters_cleaned():
+async def test__fence__when_two_tasks_share_event__then_both_cancelled_and_waiters_cleaned(never):
     event = asyncio.Event()
 
     async def worker() -> Fence:
         with Fence(EventTrigger(event)) as fence:
-            await asyncio.sleep(10)
+            await never()
         return fence
 
     t1 = asyncio.create_task(worker())
@@ -374,8 +466,49 @@ async def test__fence__when_two_tasks_share_event__then_both_cancelled_and_waite
     assert len(event._waiters) == 2
 
     event.set()
-    fence1, fence2 = await asyncio.gather(t1, t2)
+    await asyncio.wait({t1, t2})
+    fence1, fence2 = t1.result(), t2.result()
 
     assert fence1.cancelled
     assert fence2.cancelled
     assert len(event._waiters) == 0
+
+
+async def test__fence__when_nested_fences_share_event__then_waiters_cleaned():
+    event = asyncio.Event()
+
+    with Fence(EventTrigger(event)):
+        with Fence(EventTrigger(event)):
+            assert len(event._waiters) == 2
+        assert len(event._waiters) == 1
+
+    assert len(event._waiters) == 0
+
+
+async def test__triggers__when_builtin__then_have_no_instance_dict():
+    objects = _builtin_triggers_and_handles()
+
+    assert not any(hasattr(obj, "__dict__") for obj in objects)
+
+
+async def test__triggers__when_builtin__then_weakly_referenceable():
+    objects = _builtin_triggers_and_handles()
+
+    assert all(weakref.ref(obj)() is obj for obj in objects)
+
+
+def test__triggers__when_constructed_outside_loop__then_no_loop_required():
+    event = asyncio.Event()
+
+    EventTrigger(event)
+    TimeoutTrigger(1)
+
+    assert not event._waiters
+
+
+def _builtin_triggers_and_handles() -> list[Trigger | TriggerHandle]:
+    triggers: list[Trigger] = [TimeoutTrigger(1), EventTrigger(asyncio.Event())]
+    handles = [trigger.arm(lambda reason: None) for trigger in triggers]
+    for handle in handles:
+        handle.disarm()
+    return [*triggers, *handles]